@@ -2,10 +2,16 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import re
+import io
+import urllib.request
+import altair as alt
 from datetime import datetime
-import time
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Set page config first
 st.set_page_config(
@@ -15,116 +21,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling with animations
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-        animation: fadeIn 1s ease-in;
-    }
-    .section-header {
-        font-size: 1.4rem;
-        color: #2c3e50;
-        margin: 1.5rem 0 1rem 0;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid #3498db;
-        font-weight: 600;
-        animation: slideIn 0.5s ease-out;
-    }
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #3498db;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin: 0.5rem 0;
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-        animation: fadeInUp 0.6s ease-out;
-    }
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    .chart-container {
-        background-color: white;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border: 1px solid #e1e8ed;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        animation: fadeIn 0.8s ease-out;
-    }
-    .insight-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        animation: pulse 2s infinite;
-    }
-    .front-desk-impact {
-        background-color: #f8fff8;
-        border-left: 4px solid #27ae60;
-        padding: 12px;
-        margin: 8px 0;
-        border-radius: 8px;
-        font-size: 0.9em;
-    }
-    .business-impact {
-        background-color: #f0f8ff;
-        border-left: 4px solid #2980b9;
-        padding: 12px;
-        margin: 8px 0;
-        border-radius: 8px;
-        font-size: 0.9em;
-    }
-
-    /* Animations */
-    @keyframes fadeIn {
-        from { opacity: 0; }
-        to { opacity: 1; }
-    }
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    @keyframes slideIn {
-        from {
-            opacity: 0;
-            transform: translateX(-20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    @keyframes pulse {
-        0% { transform: scale(1); }
-        50% { transform: scale(1.02); }
-        100% { transform: scale(1); }
-    }
-
-    /* Progress bar for loading */
-    .stProgress > div > div > div > div {
-        background-color: #3498db;
-    }
-
-    /* Sidebar styling */
-    .css-1d391kg {
-        background-color: #f8f9fa;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better styling with animations, served once from ./static so the
+# browser caches it instead of receiving the whole stylesheet on every rerun
+st.markdown('<link rel="stylesheet" href="app/static/styles.css">', unsafe_allow_html=True)
 
 # ------------------- Data Load -------------------
 @st.cache_data
@@ -138,7 +37,15 @@ def load_data():
         progress_bar.progress(30)
 
         sheet_url = "https://docs.google.com/spreadsheets/d/1Syrq5xPz9VZ6iBJ79TMtFGvT3w7ZGP4GpgbbQZv11Dk/export?format=csv"
-        df = pd.read_csv(sheet_url)
+        # Fetch the sheet once; the header check and the full parse both read from this text
+        with urllib.request.urlopen(sheet_url) as response:
+            csv_text = response.read().decode("utf-8")
+
+        # Fast path: parse Call Time during ingest when the raw header matches exactly,
+        # otherwise it is parsed after the column names are cleaned below
+        raw_columns = pd.read_csv(io.StringIO(csv_text), nrows=0).columns
+        parse_dates = ["Call Time"] if "Call Time" in raw_columns else None
+        df = pd.read_csv(io.StringIO(csv_text), parse_dates=parse_dates)
 
         progress_bar.progress(60)
         status_text.text("Processing data...")
@@ -146,68 +53,133 @@ def load_data():
         # Clean column names
         df.columns = df.columns.str.strip().str.replace(" ", "_")
 
-        # Convert Call_Time to datetime
-        df["Call_Time"] = pd.to_datetime(df["Call_Time"], errors="coerce")
-
-        # Create date features
-        df["Date"] = df["Call_Time"].dt.date
-        df["Hour"] = df["Call_Time"].dt.hour
-        df["Day_Of_Week"] = df["Call_Time"].dt.day_name()
-
-        # Fill missing values
-        df.fillna("", inplace=True)
+        # Fall back to a coercing parse when read_csv couldn't parse every value
+        if not pd.api.types.is_datetime64_any_dtype(df["Call_Time"]):
+            df["Call_Time"] = pd.to_datetime(df["Call_Time"], errors="coerce")
 
         # Convert duration columns to numeric
         duration_cols = ['Ring_Duration', 'Conversation_Duration', 'Voicemail_Duration', 'Total_Duration']
         for col in duration_cols:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[col] = pd.to_numeric(df[col], errors='coerce', downcast='float')
+
+        # Fill missing values in text columns only; datetime/numeric columns keep NaT/NaN
+        string_cols = df.select_dtypes(include=["object", "string"]).columns
+        df[string_cols] = df[string_cols].fillna("")
+
+        # Create date features
+        ct = df["Call_Time"]
+        df["Date"] = ct.dt.normalize()
+        df["Hour"] = ct.dt.hour.astype('Int8')
+        df["Day_Of_Week"] = ct.dt.day_name().astype('category')
+
+        # Newest calls first; filtering preserves this order, so the explorer never has to re-sort
+        df = df.sort_values("Call_Time", ascending=False).reset_index(drop=True)
 
         progress_bar.progress(100)
-        status_text.text("✅ Data loaded successfully!")
-        time.sleep(0.5)  # Brief pause to show completion
         progress_bar.empty()
         status_text.empty()
 
-        return df
+        # Content hash identifies this data version for downstream caches
+        data_version = int(pd.util.hash_pandas_object(df).sum())
+
+        return df, df['Date'].min().date(), df['Date'].max().date(), data_version
 
     except Exception as e:
         st.error(f"❌ Error loading data: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), None, None, None
 
 # ------------------- Enhanced Classification -------------------
-def classify_call(transcript, call_status):
-    try:
-        t = str(transcript).lower()
-        status = str(call_status).lower()
-
-        if "missed" in status:
-            return "Missed Call"
-        elif any(w in t for w in ["book", "appointment", "schedule", "availability"]):
-            return "Appointment Booking"
-        elif any(w in t for w in ["cancel", "reschedule", "postpone"]):
-            return "Cancellation/Reschedule"
-        elif any(w in t for w in ["insurance", "coverage", "benefit"]):
-            return "Insurance Inquiry"
-        elif any(w in t for w in ["bill", "payment", "price", "fee", "charge"]):
-            return "Billing/Payment"
-        elif any(w in t for w in ["pain", "tooth", "emergency", "hurt", "swelling", "broken"]):
-            return "Emergency/Clinical"
-        elif any(w in t for w in ["follow up", "check up", "cleaning", "exam"]):
-            return "Follow-up/Routine Care"
-        elif any(w in t for w in ["prescription", "medicine", "medication"]):
-            return "Prescription Related"
-        else:
-            return "General Inquiry"
-    except:
-        return "General Inquiry"
+# Single source of truth for transcript keywords, in priority order; the regexes
+# and the keyword automaton below are both built from this table
+CATEGORY_KEYWORDS = {
+    "Appointment Booking": ("book", "appointment", "schedule", "availability"),
+    "Cancellation/Reschedule": ("cancel", "reschedule", "postpone"),
+    "Insurance Inquiry": ("insurance", "coverage", "benefit"),
+    "Billing/Payment": ("bill", "payment", "price", "fee", "charge"),
+    "Emergency/Clinical": ("pain", "tooth", "emergency", "hurt", "swelling", "broken"),
+    "Follow-up/Routine Care": ("follow up", "check up", "cleaning", "exam"),
+    "Prescription Related": ("prescription", "medicine", "medication"),
+}
+
+# Labels in priority order: missed calls first, "General Inquiry" is the fallback and always last
+CATEGORIES = ["Missed Call", *CATEGORY_KEYWORDS, "General Inquiry"]
+
+MISSED_RE = re.compile(r"missed")
+CATEGORY_RES = [re.compile("|".join(map(re.escape, kws))) for kws in CATEGORY_KEYWORDS.values()]
+
+if ahocorasick is not None:
+    # One automaton over all keywords: each transcript is scanned once regardless of keyword count
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for code, kws in enumerate(CATEGORY_KEYWORDS.values(), start=1):
+        for kw in kws:
+            # Keep the higher-priority category if a keyword is listed twice
+            if not KEYWORD_AUTOMATON.exists(kw):
+                KEYWORD_AUTOMATON.add_word(kw, code)
+    KEYWORD_AUTOMATON.make_automaton()
+else:
+    KEYWORD_AUTOMATON = None
+
+def classify_calls(df):
+    # Lowercase once up front; the compiled patterns are then case-sensitive
+    t = df['transcript'].astype(str).str.lower()
+    s = df['Call_Status'].astype(str).str.lower()
+
+    if KEYWORD_AUTOMATON is not None:
+        missed = s.str.contains(MISSED_RE, na=False).to_numpy()
+        out = np.full(len(df), len(CATEGORIES) - 1, dtype=np.int8)
+        for i, txt in enumerate(t.fillna("")):
+            if missed[i]:
+                out[i] = 0
+                continue
+            # Lower code means higher priority, so keep the smallest matched code
+            for _, code in KEYWORD_AUTOMATON.iter(txt):
+                if code < out[i]:
+                    out[i] = code
+        return pd.Categorical.from_codes(out, CATEGORIES)
+
+    # Vectorized fallback without pyahocorasick: one regex scan per category over the whole column.
+    # Order matters: np.select picks the first matching label
+    masks = [s.str.contains(MISSED_RE, na=False)]
+    masks += [t.str.contains(pattern, na=False) for pattern in CATEGORY_RES]
+    return np.select(masks, CATEGORIES[:-1], default=CATEGORIES[-1])
 
-# ------------------- Load Data -------------------
-df = load_data()
+@st.cache_data
+def categorize(df):
+    if df.empty:
+        return df
+    df = df.copy()
+
+    # Guarantee the classifier inputs once up front instead of per-row lookups
+    if 'transcript' not in df:
+        df['transcript'] = ''
+    if 'Call_Status' not in df:
+        df['Call_Status'] = ''
+
+    # Fixed category list keeps codes stable, so equality filters compare integer codes
+    df["Category"] = pd.Categorical(classify_calls(df), categories=CATEGORIES)
+
+    # Low-cardinality string columns as categoricals: groupby/value_counts work on integer codes
+    for col in ['Call_Direction', 'Call_Status', 'Contact_Type']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+# ------------------- Aggregations -------------------
+@st.cache_data(max_entries=64)
+def compute_aggs(_filtered_df, data_version, date_lo, date_hi, dirs_tuple, cats_tuple):
+    # Keyed by the data version and filter selections; _filtered_df is skipped by the hasher
+    return {
+        "calls_per_day": _filtered_df.groupby("Date").size(),
+        "status_counts": _filtered_df["Call_Status"].value_counts().loc[lambda s: s > 0],
+        "category_counts": _filtered_df["Category"].value_counts().loc[lambda s: s > 0].head(8),
+        "hourly_calls": _filtered_df['Hour'].value_counts().sort_index(),
+        "avg_durations": _filtered_df.groupby("Category", observed=True)["Conversation_Duration"].mean().nlargest(10),
+    }
 
-if not df.empty:
-    with st.spinner("🔄 Analyzing call patterns..."):
-        df["Category"] = df.apply(lambda x: classify_call(x.get('transcript', ''), x.get('Call_Status', '')), axis=1)
+# ------------------- Load Data -------------------
+df, min_date, max_date, data_version = load_data()
+df = categorize(df)
 
 # ------------------- Title -------------------
 st.markdown('<h1 class="main-header">🦷 Dental Call Analytics</h1>', unsafe_allow_html=True)
@@ -234,11 +206,12 @@ if not df.empty:
 # ------------------- Sidebar Filters -------------------
 st.sidebar.markdown("### 🎛️ Dashboard Controls")
 
-filtered_df = df.copy()
+filtered_df = df
 
 if not df.empty:
-    min_date = filtered_df['Date'].min()
-    max_date = filtered_df['Date'].max()
+    # Categorical columns already know their distinct values, no column scan needed
+    direction_opts = df['Call_Direction'].cat.categories.tolist()
+    category_opts = df['Category'].cat.categories.tolist()
 
     st.sidebar.markdown("**📅 Date Range**")
     date_range = st.sidebar.date_input(
@@ -252,46 +225,46 @@ if not df.empty:
     st.sidebar.markdown("**📞 Call Direction**")
     call_direction = st.sidebar.multiselect(
         "Select call directions",
-        options=filtered_df['Call_Direction'].unique(),
-        default=filtered_df['Call_Direction'].unique(),
+        options=direction_opts,
+        default=direction_opts,
         label_visibility="collapsed"
     )
 
     st.sidebar.markdown("**🏷️ Call Categories**")
     call_categories = st.sidebar.multiselect(
         "Filter by category",
-        options=filtered_df['Category'].unique(),
-        default=filtered_df['Category'].unique(),
+        options=category_opts,
+        default=category_opts,
         label_visibility="collapsed"
     )
 
-    # Apply filters
+    # Apply filters as one combined mask so the frame is sliced only once
+    mask = np.ones(len(df), dtype=bool)
     if date_range and len(date_range) == 2: # Check if date_range is not None and has two elements
-        start_date = date_range[0]
-        end_date = date_range[1]
-        filtered_df = filtered_df[
-            (filtered_df['Date'] >= start_date) &
-            (filtered_df['Date'] <= end_date)
-        ]
+        dates = df['Date'].to_numpy()
+        mask &= (dates >= np.datetime64(date_range[0])) & (dates <= np.datetime64(date_range[1]))
     if call_direction:
-        filtered_df = filtered_df[filtered_df['Call_Direction'].isin(call_direction)]
+        mask &= df['Call_Direction'].isin(call_direction).to_numpy()
     if call_categories:
-        filtered_df = filtered_df[filtered_df['Category'].isin(call_categories)]
+        mask &= df['Category'].isin(call_categories).to_numpy()
+    filtered_df = df[mask]
 
 # ------------------- Key Metrics -------------------
 st.markdown('<div class="section-header">📈 Key Performance Indicators</div>', unsafe_allow_html=True)
 
 if not filtered_df.empty:
     total_calls = len(filtered_df)
-    answered_calls = len(filtered_df[filtered_df["Call_Status"].str.lower().str.contains("answered", na=False)])
-    missed_calls = len(filtered_df[filtered_df["Call_Status"].str.lower().str.contains("missed", na=False)])
+    cat_counts = filtered_df["Category"].value_counts()
+    answered_calls = int(filtered_df["Call_Status"].str.contains("answered", case=False, regex=False, na=False).sum())
+    missed_calls = int(filtered_df["Call_Status"].str.contains("missed", case=False, regex=False, na=False).sum())
     missed_rate = round((missed_calls / total_calls) * 100, 2) if total_calls else 0
     avg_conv = round(filtered_df["Conversation_Duration"].mean(), 2) if 'Conversation_Duration' in filtered_df.columns else 0
-    new_patient_calls = len(filtered_df[filtered_df["Contact_Type"] == "New Patient"]) if 'Contact_Type' in filtered_df.columns else 0
-    appointment_bookings = len(filtered_df[filtered_df["Category"] == "Appointment Booking"])
+    new_patient_calls = int((filtered_df["Contact_Type"] == "New Patient").sum()) if 'Contact_Type' in filtered_df.columns else 0
+    appointment_bookings = int(cat_counts.get("Appointment Booking", 0))
     conversion_rate = round((appointment_bookings / total_calls) * 100, 2) if total_calls else 0
 else:
     total_calls = answered_calls = missed_calls = missed_rate = avg_conv = new_patient_calls = appointment_bookings = conversion_rate = 0
+    cat_counts = pd.Series(dtype="int64")
 
 # Metrics in two rows
 col1, col2, col3, col4 = st.columns(4)
@@ -346,7 +319,7 @@ with col1:
     """, unsafe_allow_html=True)
 
 with col2:
-    emergency_calls = len(filtered_df[filtered_df["Category"] == "Emergency/Clinical"])
+    emergency_calls = int(cat_counts.get("Emergency/Clinical", 0))
     st.markdown(f"""
     <div class="metric-card">
         <div style="font-size: 0.9em; color: #666; margin-bottom: 5px;">Emergency Calls</div>
@@ -356,7 +329,7 @@ with col2:
     """, unsafe_allow_html=True)
 
 with col3:
-    billing_calls = len(filtered_df[filtered_df["Category"] == "Billing/Payment"])
+    billing_calls = int(cat_counts.get("Billing/Payment", 0))
     st.markdown(f"""
     <div class="metric-card">
         <div style="font-size: 0.9em; color: #666; margin-bottom: 5px;">Billing Calls</div>
@@ -366,7 +339,7 @@ with col3:
     """, unsafe_allow_html=True)
 
 with col4:
-    insurance_calls = len(filtered_df[filtered_df["Category"] == "Insurance Inquiry"])
+    insurance_calls = int(cat_counts.get("Insurance Inquiry", 0))
     st.markdown(f"""
     <div class="metric-card">
         <div style="font-size: 0.9em; color: #666; margin-bottom: 5px;">Insurance Calls</div>
@@ -379,6 +352,20 @@ with col4:
 st.markdown('<div class="section-header">📊 Visual Analytics</div>', unsafe_allow_html=True)
 
 if not filtered_df.empty:
+    aggs = compute_aggs(
+        filtered_df,
+        data_version,
+        date_range[0] if date_range and len(date_range) == 2 else None,
+        date_range[1] if date_range and len(date_range) == 2 else None,
+        tuple(sorted(call_direction)),
+        tuple(sorted(call_categories)),
+    )
+    calls_per_day = aggs["calls_per_day"]
+    status_counts = aggs["status_counts"]
+    category_counts = aggs["category_counts"]
+    hourly_calls = aggs["hourly_calls"]
+    avg_durations = aggs["avg_durations"]
+
     # Create tabs for different chart types
     tab1, tab2, tab3, tab4 = st.tabs(["📈 Trends", "📞 Call Types", "🕒 Patterns", "📋 Details"])
 
@@ -389,21 +376,8 @@ if not filtered_df.empty:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.markdown("**Daily Call Volume**")
 
-            fig1, ax1 = plt.subplots(figsize=(10, 4))
-            calls_per_day = filtered_df.groupby("Date").size()
-
             if not calls_per_day.empty:
-                ax1.plot(calls_per_day.index, calls_per_day.values,
-                        marker="o", color="#3498db", linewidth=2, markersize=4)
-                ax1.fill_between(calls_per_day.index, calls_per_day.values, alpha=0.2, color="#3498db")
-
-                ax1.set_xlabel("Date")
-                ax1.set_ylabel("Calls")
-                ax1.grid(True, linestyle='--', alpha=0.3)
-                ax1.tick_params(axis='x', rotation=45)
-
-                plt.tight_layout()
-                st.pyplot(fig1)
+                st.line_chart(calls_per_day)
             st.markdown('</div>', unsafe_allow_html=True)
 
         with col2:
@@ -413,7 +387,7 @@ if not filtered_df.empty:
                 peak_calls = calls_per_day.max()
                 avg_daily = calls_per_day.mean()
 
-                st.metric("Peak Day", f"{peak_calls} calls", f"on {peak_day}")
+                st.metric("Peak Day", f"{peak_calls} calls", f"on {peak_day.date()}")
                 st.metric("Daily Average", f"{avg_daily:.1f}", "calls per day")
                 st.metric("Total Period", f"{calls_per_day.sum():,}", f"over {len(calls_per_day)} days")
 
@@ -424,46 +398,37 @@ if not filtered_df.empty:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.markdown("**Call Status Distribution**")
 
-            fig2, ax2 = plt.subplots(figsize=(8, 6))
-            status_counts = filtered_df["Call_Status"].value_counts()
-
             if not status_counts.empty:
                 colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
-                wedges, texts, autotexts = ax2.pie(
-                    status_counts.values,
-                    labels=status_counts.index,
-                    autopct='%1.1f%%',
-                    startangle=90,
-                    colors=colors[:len(status_counts)],
-                    textprops={'fontsize': 10}
+                status_df = status_counts.rename_axis("Call_Status").reset_index(name="Calls")
+                status_df["Call_Status"] = status_df["Call_Status"].astype(str)
+                status_df["Share"] = status_df["Calls"] / status_df["Calls"].sum()
+                base = alt.Chart(status_df).encode(
+                    theta=alt.Theta("Calls:Q", stack=True),
+                    color=alt.Color("Call_Status:N", scale=alt.Scale(range=colors)),
+                    tooltip=["Call_Status", "Calls", alt.Tooltip("Share:Q", format=".1%")]
                 )
-
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                    autotext.set_fontweight('bold')
-
-                plt.tight_layout()
-                st.pyplot(fig2)
+                pie = base.mark_arc(outerRadius=120)
+                # Percentage labels on each wedge
+                shares = base.mark_text(radius=80, fill="white", fontWeight="bold").encode(
+                    text=alt.Text("Share:Q", format=".1%")
+                )
+                st.altair_chart(pie + shares, width="stretch")
             st.markdown('</div>', unsafe_allow_html=True)
 
         with col2:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.markdown("**Call Categories**")
 
-            category_counts = filtered_df["Category"].value_counts().head(8)
-            fig3, ax3 = plt.subplots(figsize=(8, 6))
-
             if not category_counts.empty:
-                y_pos = np.arange(len(category_counts))
-                colors = plt.cm.Set3(np.linspace(0, 1, len(category_counts)))
-
-                bars = ax3.barh(y_pos, category_counts.values, color=colors, alpha=0.8)
-                ax3.set_yticks(y_pos)
-                ax3.set_yticklabels(category_counts.index, fontsize=10)
-                ax3.set_xlabel("Number of Calls")
-
-                plt.tight_layout()
-                st.pyplot(fig3)
+                category_df = category_counts.rename_axis("Category").reset_index(name="Calls")
+                category_df["Category"] = category_df["Category"].astype(str)
+                bars = alt.Chart(category_df).mark_bar(opacity=0.8).encode(
+                    x=alt.X("Calls:Q", title="Number of Calls"),
+                    y=alt.Y("Category:N", sort="-x", title=None),
+                    tooltip=["Category", "Calls"]
+                )
+                st.altair_chart(bars, width="stretch")
             st.markdown('</div>', unsafe_allow_html=True)
 
     with tab3:
@@ -473,18 +438,8 @@ if not filtered_df.empty:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.markdown("**Hourly Call Pattern**")
 
-            fig4, ax4 = plt.subplots(figsize=(10, 4))
-            hourly_calls = filtered_df['Hour'].value_counts().sort_index()
-
             if not hourly_calls.empty:
-                ax4.bar(hourly_calls.index, hourly_calls.values, alpha=0.7, color='#3498db')
-                ax4.set_xlabel("Hour of Day")
-                ax4.set_ylabel("Number of Calls")
-                ax4.set_xticks(range(0, 24, 2))
-                ax4.grid(True, alpha=0.3)
-
-                plt.tight_layout()
-                st.pyplot(fig4)
+                st.bar_chart(hourly_calls)
             st.markdown('</div>', unsafe_allow_html=True)
 
         with col2:
@@ -502,26 +457,20 @@ if not filtered_df.empty:
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.markdown("**Call Duration by Category**")
 
-        avg_durations = filtered_df.groupby("Category")["Conversation_Duration"].mean().nlargest(10)
-        fig5, ax5 = plt.subplots(figsize=(10, 6))
-
         if not avg_durations.empty:
-            y_pos = np.arange(len(avg_durations))
-            colors = plt.cm.viridis(np.linspace(0, 1, len(avg_durations)))
-
-            bars = ax5.barh(y_pos, avg_durations.values, color=colors, alpha=0.8)
-            ax5.set_yticks(y_pos)
-            ax5.set_yticklabels(avg_durations.index, fontsize=10)
-            ax5.set_xlabel("Average Duration (seconds)")
-
-            # Add value labels
-            for i, bar in enumerate(bars):
-                width = bar.get_width()
-                ax5.text(width + 1, bar.get_y() + bar.get_height()/2,
-                        f'{width:.1f}s', ha='left', va='center', fontsize=9)
-
-            plt.tight_layout()
-            st.pyplot(fig5)
+            duration_df = avg_durations.rename_axis("Category").reset_index(name="Avg Duration")
+            duration_df["Category"] = duration_df["Category"].astype(str)
+            base = alt.Chart(duration_df).encode(
+                x=alt.X("Avg Duration:Q", title="Average Duration (seconds)"),
+                y=alt.Y("Category:N", sort="-x", title=None),
+                tooltip=["Category", alt.Tooltip("Avg Duration:Q", format=".1f")]
+            )
+            bars = base.mark_bar(opacity=0.8)
+            # Value labels just past the end of each bar
+            labels = base.mark_text(align="left", dx=3).transform_calculate(
+                label="format(datum['Avg Duration'], '.1f') + 's'"
+            ).encode(text="label:N")
+            st.altair_chart(bars + labels, width="stretch")
         st.markdown('</div>', unsafe_allow_html=True)
 
 # ------------------- Business Insights -------------------
@@ -573,8 +522,9 @@ if not filtered_df.empty:
     with col2:
         st.markdown("**Call Details**")
         if show_columns:
+            top = filtered_df.head(rows_to_show)
             st.dataframe(
-                filtered_df[show_columns].sort_values('Call_Time', ascending=False).head(rows_to_show),
+                top[show_columns],
                 width='stretch',
                 height=400
             )
@@ -590,6 +540,3 @@ st.markdown("""
     <small>Built for dental practices to optimize front desk operations and drive growth</small>
 </div>
 """, unsafe_allow_html=True)
-
-# Clear figures
-plt.close('all')